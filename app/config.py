@@ -1,4 +1,6 @@
+import functools
 import os
+import tempfile
 from dotenv import load_dotenv
 from google.oauth2 import service_account
 
@@ -6,9 +8,24 @@ load_dotenv()
 
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
+# LLM response cache – SQLite file, and entry lifetime in seconds (0 disables)
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH", os.path.join(tempfile.gettempdir(), "tracker-agent-llm-cache.sqlite3")
+)
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+
+# Comma-separated origins allowed to call the API cross-origin ("*" for any)
+FRONTEND_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("FRONTEND_ORIGIN", "*").split(",")
+    if origin.strip()
+]
+
 JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
 JIRA_EMAIL = os.getenv("JIRA_EMAIL")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
+# Max pooled connections to Jira shared by concurrent requests
+JIRA_CONNECTION_POOL_SIZE = int(os.getenv("JIRA_CONNECTION_POOL_SIZE", "20"))
 
 # GCP credentials – either individual env vars (Vercel) or a JSON key file (local)
 GCP_CLIENT_EMAIL = os.getenv("GCP_CLIENT_EMAIL")
@@ -17,28 +34,47 @@ GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID")
 GOOGLE_SERVICE_ACCOUNT_FILE = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", "service-account.json")
 
 
+def _normalise_private_key(pk: str) -> str:
+    """Strip wrapping quotes, convert literal "\\n" sequences to real newlines, and trim whitespace."""
+    pk = pk.strip()
+    if pk.startswith('"') and pk.endswith('"'):
+        pk = pk[1:-1]
+    return pk.replace("\\n", "\n")
+
+
+# Service-account info built once from the env vars, or None to use the key file
+_GCP_SERVICE_ACCOUNT_INFO = (
+    {
+        "type": "service_account",
+        "project_id": GCP_PROJECT_ID,
+        "client_email": GCP_CLIENT_EMAIL,
+        "private_key": _normalise_private_key(GCP_PRIVATE_KEY),
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+    if GCP_CLIENT_EMAIL and GCP_PRIVATE_KEY and GCP_PROJECT_ID
+    else None
+)
+
+
 def get_google_credentials(scopes: list[str]) -> service_account.Credentials:
     """Build Google service-account credentials.
 
     Prefers individual env vars (GCP_CLIENT_EMAIL, GCP_PRIVATE_KEY,
     GCP_PROJECT_ID) which work on Vercel.  Falls back to a local JSON
     key file for development.
+
+    Credentials are cached per set of scopes (order-insensitive), so the
+    key is only loaded and parsed once per process.
     """
-    if GCP_CLIENT_EMAIL and GCP_PRIVATE_KEY and GCP_PROJECT_ID:
-        # Normalise the private key: strip wrapping quotes, convert literal
-        # "\n" sequences to real newlines, and trim whitespace.
-        pk = GCP_PRIVATE_KEY.strip()
-        if pk.startswith('"') and pk.endswith('"'):
-            pk = pk[1:-1]
-        pk = pk.replace("\\n", "\n")
-        info = {
-            "type": "service_account",
-            "project_id": GCP_PROJECT_ID,
-            "client_email": GCP_CLIENT_EMAIL,
-            "private_key": pk,
-            "token_uri": "https://oauth2.googleapis.com/token",
-        }
-        return service_account.Credentials.from_service_account_info(info, scopes=scopes)
+    return _get_google_credentials(tuple(sorted(set(scopes))))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_google_credentials(scopes: tuple[str, ...]) -> service_account.Credentials:
+    if _GCP_SERVICE_ACCOUNT_INFO is not None:
+        return service_account.Credentials.from_service_account_info(
+            _GCP_SERVICE_ACCOUNT_INFO, scopes=scopes
+        )
 
     return service_account.Credentials.from_service_account_file(
         GOOGLE_SERVICE_ACCOUNT_FILE, scopes=scopes
@@ -10,13 +10,15 @@ A schema-driven reporting engine that:
 6. Writes leadership summaries back to the tracker sheet
 """
 
+import hashlib
+import re
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 
+from app.config import FRONTEND_ORIGINS
 from app.routes import generate, post, sheet
 
 app = FastAPI(
@@ -27,18 +29,47 @@ app = FastAPI(
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=FRONTEND_ORIGINS,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 app.include_router(generate.router)
 app.include_router(post.router)
 app.include_router(sheet.router)
 
+# Filenames carrying a content hash, e.g. app.3f9a1c2b.js
+_HASHED_ASSET_RE = re.compile(r"\.[0-9a-fA-F]{8,}\.\w+$")
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache assets instead of re-fetching them.
+
+    Content-hashed files can never change under the same name, so they are
+    marked immutable for a year; everything else gets a short TTL.
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code == 200:
+            if _HASHED_ASSET_RE.search(path):
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            else:
+                response.headers["Cache-Control"] = "public, max-age=300"
+        return response
+
+
 # Serve static frontend assets
 _static_dir = Path(__file__).resolve().parent / "static"
-app.mount("/static", StaticFiles(directory=str(_static_dir)), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(_static_dir)), name="static")
+
+# The SPA shell never changes while the process runs, so read it once.
+_INDEX_BYTES = (_static_dir / "index.html").read_bytes()
+_INDEX_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": '"' + hashlib.md5(_INDEX_BYTES).hexdigest() + '"',
+}
 
 
 @app.get("/health")
@@ -47,5 +78,7 @@ def health():
 
 
 @app.get("/")
-def index():
-    return FileResponse(str(_static_dir / "index.html"))
+def index(request: Request):
+    if request.headers.get("if-none-match") == _INDEX_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    return Response(content=_INDEX_BYTES, media_type="text/html", headers=_INDEX_HEADERS)
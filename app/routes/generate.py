@@ -5,9 +5,13 @@ Reads sheet data, fetches notes documents, and generates
 AI-powered Jira update drafts for human review.
 """
 
+import asyncio
 import logging
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from app.schemas import GenerateRequest
 from app.services import sheets, docs, parser, llm
@@ -16,24 +20,78 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["generate"])
 
+# Upper bound on tracks processed concurrently, to stay within
+# Google Docs and Anthropic rate limits.
+MAX_CONCURRENT_TRACKS = 8
+
+
+async def _process_track(track: dict, semaphore: asyncio.Semaphore) -> Optional[dict]:
+    """Fetch a track's notes and generate its updates. Returns None for tracks without milestones."""
+    # Skip tracks with no milestones
+    if not track.get("milestones"):
+        return None
+
+    async with semaphore:
+        # Fetch notes document if link exists
+        notes_text = ""
+        if track.get("notes_link"):
+            try:
+                notes_text = await asyncio.to_thread(docs.get_doc_text, track["notes_link"])
+            except Exception as e:
+                notes_text = f"[Error fetching notes: {e}]"
+
+        track["notes_text"] = notes_text
+
+        # Generate AI updates
+        try:
+            ai_result = await llm.generate_jira_updates(track)
+            logger.info("Generated %d update(s) for track '%s'", len(ai_result.get("updates", [])), track["track"])
+            return ai_result
+        except Exception as e:
+            logger.error("LLM generation failed for track '%s': %s", track["track"], e)
+            return {
+                "workstream": track.get("workstream", ""),
+                "track": track.get("track", ""),
+                "error": str(e),
+                "updates": [],
+            }
+
+
+async def _stream_results(tasks: list[asyncio.Task]) -> AsyncIterator[bytes]:
+    """Yield each track's result as an NDJSON line as soon as it completes."""
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result is not None:
+                yield orjson.dumps(result) + b"\n"
+    finally:
+        # Client went away mid-stream: stop scheduling remaining work
+        for task in tasks:
+            task.cancel()
+
 
 @router.post("/generate-preview")
-def generate_preview(request: GenerateRequest):
+async def generate_preview(request: GenerateRequest, http_request: Request):
     """
     Generate AI-powered Jira update previews for tracks in a tracker sheet.
+
+    Clients that send ``Accept: application/x-ndjson`` receive one result
+    object per line, in completion order. Otherwise all results are returned
+    together once every track is done. Lines are only delivered as each
+    track finishes where the server streams responses; the @vercel/python
+    runtime buffers the whole body (see README).
     """
-    # Step 1: Read sheet
+    # Step 1: Read sheet (raw values; parsed directly without row dicts)
     try:
-        rows = sheets.read_sheet(request.sheet_id)
+        values = await asyncio.to_thread(sheets.read_values, request.sheet_id)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to read sheet: {e}")
 
-    if not rows:
+    if len(values) < 2:
         raise HTTPException(status_code=400, detail="Sheet is empty or has no data rows.")
 
     # Step 2: Validate schema
-    headers = list(rows[0].keys())
-    missing = parser.validate_schema(headers)
+    missing = parser.validate_schema(values[0])
     if missing:
         raise HTTPException(
             status_code=400,
@@ -41,7 +99,7 @@ def generate_preview(request: GenerateRequest):
         )
 
     # Step 3: Parse into hierarchy
-    parsed_tracks = parser.parse_sheet_rows(rows)
+    parsed_tracks = parser.parse_sheet_values(values)
     logger.info(
         "Parsed %d track(s) with milestones: %s",
         len(parsed_tracks),
@@ -63,39 +121,18 @@ def generate_preview(request: GenerateRequest):
                 detail=f"Track '{request.track_name}' not found in sheet.",
             )
 
-    # Step 5: Generate updates for each track
-    results = []
-
-    for track in parsed_tracks:
-        # Fetch notes document if link exists
-        notes_text = ""
-        if track.get("notes_link"):
-            try:
-                notes_text = docs.get_doc_text(track["notes_link"])
-            except Exception as e:
-                notes_text = f"[Error fetching notes: {e}]"
+    # Step 5: Generate updates for all tracks concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRACKS)
+    tasks = [
+        asyncio.create_task(_process_track(track, semaphore))
+        for track in parsed_tracks
+    ]
 
-        track["notes_text"] = notes_text
-
-        # Skip tracks with no milestones
-        if not track.get("milestones"):
-            continue
-
-        # Generate AI updates
-        try:
-            ai_result = llm.generate_jira_updates(track)
-            logger.info("Generated %d update(s) for track '%s'", len(ai_result.get("updates", [])), track["track"])
-            results.append(ai_result)
-        except Exception as e:
-            logger.error("LLM generation failed for track '%s': %s", track["track"], e)
-            results.append({
-                "workstream": track.get("workstream", ""),
-                "track": track.get("track", ""),
-                "error": str(e),
-                "updates": [],
-            })
+    if "application/x-ndjson" in http_request.headers.get("accept", ""):
+        return StreamingResponse(_stream_results(tasks), media_type="application/x-ndjson")
 
-    return {"results": results}
+    results = await asyncio.gather(*tasks)
+    return {"results": [r for r in results if r is not None]}
 
 
 @router.get("/debug-parse/{sheet_id}")
@@ -5,21 +5,38 @@ Handles posting approved updates to Jira and writing
 leadership summaries back to the tracker sheet.
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 
-from app.schemas import PostToJiraRequest, UpdateSheetRequest
+from app.schemas import (
+    BulkPostToJiraRequest,
+    BulkUpdateSheetRequest,
+    PostToJiraRequest,
+    UpdateSheetRequest,
+)
 from app.services import jira, sheets
+from app.services.parser import normalize_jira_key
 
 router = APIRouter(tags=["post"])
 
 
+def _col_letter(index: int) -> str:
+    """Convert a zero-based column index to its A1 column letters (0 -> A, 26 -> AA)."""
+    letters = ""
+    while index >= 0:
+        letters = chr(index % 26 + ord("A")) + letters
+        index = index // 26 - 1
+    return letters
+
+
 @router.post("/post-to-jira")
-def post_to_jira(request: PostToJiraRequest):
+async def post_to_jira(request: PostToJiraRequest):
     """
     Post an approved comment to a Jira issue.
     """
     try:
-        result = jira.post_comment(request.jira_id, request.comment)
+        result = await jira.post_comment(request.jira_id, request.comment)
         return {"status": "posted", "jira_id": request.jira_id, "response": result}
     except Exception as e:
         raise HTTPException(
@@ -28,6 +45,89 @@ def post_to_jira(request: PostToJiraRequest):
         )
 
 
+@router.post("/post-to-jira/bulk")
+async def post_to_jira_bulk(request: BulkPostToJiraRequest):
+    """
+    Post several approved comments to Jira concurrently.
+
+    Each item is reported individually; failures do not stop the others.
+    At most MAX_BULK_ITEMS items are accepted, and comments still pending
+    after jira.BULK_POST_TIMEOUT seconds are reported as timed out.
+    """
+    responses = await jira.post_comments(
+        [(item.jira_id, item.comment) for item in request.items]
+    )
+
+    results = []
+    for item, response in zip(request.items, responses):
+        if isinstance(response, Exception):
+            results.append({"status": "error", "jira_id": item.jira_id, "error": str(response)})
+        else:
+            results.append({"status": "posted", "jira_id": item.jira_id, "response": response})
+
+    return {"results": results}
+
+
+def _milestone_rows(sheet_id: str) -> tuple[dict[str, int], Optional[str]]:
+    """
+    Locate the milestone rows of a sheet from a fresh read.
+
+    Returns a map of normalized Jira ID to 1-based sheet row number, and the
+    Status Update column letter (None if the sheet has no such column).
+
+    The sheet is read in a single request right before the write: rows
+    inserted, deleted or sorted since the last dashboard load must not
+    redirect a summary onto another milestone's row.
+    """
+    values = sheets.read_values(sheet_id)
+    headers = values[0] if values else []
+
+    status_col = None
+    if "Status Update" in headers:
+        status_col = _col_letter(headers.index("Status Update"))
+
+    if "WorkType" not in headers or "Jira ID" not in headers:
+        return {}, status_col
+
+    work_type_col = headers.index("WorkType")
+    jira_id_col = headers.index("Jira ID")
+
+    rows: dict[str, int] = {}
+    # values[0] is the header row, so values[i] is sheet row i + 1
+    for i in range(1, len(values)):
+        row_values = values[i]
+        # The API omits trailing empty cells
+        if work_type_col >= len(row_values) or row_values[work_type_col].strip() != "Milestone":
+            continue
+        row_jira_id = row_values[jira_id_col].strip() if jira_id_col < len(row_values) else ""
+        # The first matching row wins
+        rows.setdefault(normalize_jira_key(row_jira_id), i + 1)
+
+    return rows, status_col
+
+
+def _summary_cell(rows: dict[str, int], status_col: Optional[str], jira_id: str) -> str:
+    """
+    Return the A1 range of the Status Update cell for the milestone row
+    identified by its Jira ID.
+    """
+    milestone_row_index = rows.get(normalize_jira_key(jira_id.strip()))
+
+    if milestone_row_index is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Milestone with Jira ID '{jira_id}' not found in sheet.",
+        )
+
+    if status_col is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Sheet does not have a 'Status Update' column.",
+        )
+
+    return f"Sheet1!{status_col}{milestone_row_index}"
+
+
 @router.post("/update-sheet-summary")
 def update_sheet_summary(request: UpdateSheetRequest):
     """
@@ -35,39 +135,9 @@ def update_sheet_summary(request: UpdateSheetRequest):
     of the milestone row identified by its Jira ID.
     """
     try:
-        from app.services.parser import normalize_jira_key
-
-        rows = sheets.read_sheet(request.sheet_id)
-
-        # Find the milestone row by matching Jira ID
-        normalized_request_id = normalize_jira_key(request.jira_id.strip())
-        milestone_row_index = None
-        for i, row in enumerate(rows):
-            work_type = (row.get("WorkType") or "").strip()
-            jira_id = (row.get("Jira ID") or "").strip()
-            if work_type == "Milestone" and normalize_jira_key(jira_id) == normalized_request_id:
-                # +2 because: +1 for header row, +1 for 1-based indexing
-                milestone_row_index = i + 2
-                break
-
-        if milestone_row_index is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Milestone with Jira ID '{request.jira_id}' not found in sheet.",
-            )
-
-        # Find the Status Update column letter
-        headers = list(rows[0].keys())
-        if "Status Update" not in headers:
-            raise HTTPException(
-                status_code=400,
-                detail="Sheet does not have a 'Status Update' column.",
-            )
-
-        col_index = headers.index("Status Update")
-        col_letter = chr(ord("A") + col_index)  # Works for columns A-Z
-
-        cell_range = f"Sheet1!{col_letter}{milestone_row_index}"
+        rows, status_col = _milestone_rows(request.sheet_id)
+
+        cell_range = _summary_cell(rows, status_col, request.jira_id)
         sheets.update_cell(request.sheet_id, cell_range, request.leadership_summary)
 
         return {
@@ -80,3 +150,34 @@ def update_sheet_summary(request: UpdateSheetRequest):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update sheet: {e}")
+
+
+@router.post("/update-sheet-summary/bulk")
+def update_sheet_summary_bulk(request: BulkUpdateSheetRequest):
+    """
+    Write several leadership summaries with one lookup of the milestone
+    rows and one batched write. Milestones that cannot be located are reported
+    individually and do not block the others. At most MAX_BULK_ITEMS items
+    are accepted.
+    """
+    try:
+        rows, status_col = _milestone_rows(request.sheet_id)
+
+        results = []
+        updates = []
+        for item in request.items:
+            try:
+                cell_range = _summary_cell(rows, status_col, item.jira_id)
+            except HTTPException as e:
+                results.append({"status": "error", "jira_id": item.jira_id, "error": e.detail})
+                continue
+            updates.append((cell_range, item.leadership_summary))
+            results.append({"status": "updated", "jira_id": item.jira_id, "cell": cell_range})
+
+        if updates:
+            sheets.update_cells(request.sheet_id, updates)
+
+        return {"results": results}
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to update sheet: {e}")
@@ -4,18 +4,36 @@ Sheet reading endpoint.
 Returns raw tracker sheet rows for the frontend dashboard table.
 """
 
-from fastapi import APIRouter, HTTPException
+import hashlib
+from typing import Optional
+
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from app.services import sheets, parser
 
 router = APIRouter(tags=["sheet"])
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
 @router.get("/read-sheet/{sheet_id}")
-def read_sheet(sheet_id: str):
+def read_sheet(sheet_id: str, request: Request):
     """
     Read a tracker sheet and return validated, structured data
     for the dashboard table.
+
+    Responses carry an ETag of the body, so a client revalidating an
+    unchanged sheet gets an empty 304 instead of the full payload.
     """
     try:
         rows = sheets.read_sheet(sheet_id)
@@ -25,12 +43,20 @@ def read_sheet(sheet_id: str):
     if not rows:
         raise HTTPException(status_code=400, detail="Sheet is empty or has no data rows.")
 
-    headers = list(rows[0].keys())
-    missing = parser.validate_schema(headers)
+    missing = parser.validate_schema(rows[0].keys())
     if missing:
         raise HTTPException(
             status_code=400,
             detail=f"Sheet is missing required columns: {', '.join(missing)}",
         )
 
-    return {"rows": rows}
+    body = orjson.dumps({"rows": rows})
+    headers = {
+        "Cache-Control": "no-cache",
+        "ETag": '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"',
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
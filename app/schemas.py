@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
+# Upper bound on the items accepted by the bulk endpoints
+MAX_BULK_ITEMS = 50
+
 
 class Milestone(BaseModel):
     name: str
@@ -45,7 +48,21 @@ class PostToJiraRequest(BaseModel):
     comment: str
 
 
+class BulkPostToJiraRequest(BaseModel):
+    items: List[PostToJiraRequest] = Field(..., max_length=MAX_BULK_ITEMS)
+
+
 class UpdateSheetRequest(BaseModel):
     sheet_id: str
     jira_id: str
     leadership_summary: str
+
+
+class SheetSummary(BaseModel):
+    jira_id: str
+    leadership_summary: str
+
+
+class BulkUpdateSheetRequest(BaseModel):
+    sheet_id: str
+    items: List[SheetSummary] = Field(..., max_length=MAX_BULK_ITEMS)
@@ -5,6 +5,7 @@ Reads the full text content of a Google Doc given its URL or document ID.
 """
 
 import re
+import threading
 
 from googleapiclient.discovery import build
 
@@ -12,47 +13,59 @@ from app.config import get_google_credentials
 
 SCOPES = ["https://www.googleapis.com/auth/documents.readonly"]
 
+_DOC_ID_RE = re.compile(r"/document/d/([a-zA-Z0-9_-]+)")
+
+
+_local = threading.local()
+
 
 def _get_docs_service():
-    credentials = get_google_credentials(SCOPES)
-    return build("docs", "v1", credentials=credentials)
+    """
+    Return a Docs API client, building it at most once per thread.
+
+    The underlying httplib2 transport is not thread-safe, so each worker
+    thread keeps its own client instead of sharing one process-wide.
+    """
+    service = getattr(_local, "service", None)
+    if service is None:
+        credentials = get_google_credentials(SCOPES)
+        service = build("docs", "v1", credentials=credentials, cache_discovery=False)
+        _local.service = service
+    return service
 
 
 def extract_doc_id(url_or_id: str) -> str:
     """
     Extract the Google Doc ID from a URL or return as-is if already an ID.
     """
-    match = re.search(r"/document/d/([a-zA-Z0-9_-]+)", url_or_id)
+    if "/" not in url_or_id:
+        return url_or_id.strip()
+
+    match = _DOC_ID_RE.search(url_or_id)
     if match:
         return match.group(1)
     return url_or_id.strip()
 
 
-def _read_structural_elements(elements: list) -> str:
-    """Recursively extract text from Google Docs structural elements."""
-    text_parts: list[str] = []
-
+def _read_structural_elements(elements: list, out: list[str]) -> None:
+    """Recursively collect text from Google Docs structural elements into ``out``."""
     for element in elements:
         if "paragraph" in element:
             paragraph = element["paragraph"]
             for elem in paragraph.get("elements", []):
                 text_run = elem.get("textRun")
                 if text_run:
-                    text_parts.append(text_run.get("content", ""))
+                    out.append(text_run.get("content", ""))
 
         elif "table" in element:
             table = element["table"]
             for row in table.get("tableRows", []):
                 for cell in row.get("tableCells", []):
-                    text_parts.append(
-                        _read_structural_elements(cell.get("content", []))
-                    )
+                    _read_structural_elements(cell.get("content", []), out)
 
         elif "sectionBreak" in element:
             pass  # skip section breaks
 
-    return "".join(text_parts)
-
 
 def get_doc_text(url_or_id: str) -> str:
     """
@@ -65,4 +78,6 @@ def get_doc_text(url_or_id: str) -> str:
     body = document.get("body", {})
     content = body.get("content", [])
 
-    return _read_structural_elements(content)
+    text_parts: list[str] = []
+    _read_structural_elements(content, text_parts)
+    return "".join(text_parts)
@@ -5,31 +5,100 @@ Posts comments to Jira issues using the Jira REST API v2.
 Uses v2 for broad compatibility with both Jira Cloud and Server/DC.
 """
 
-import requests
-from requests.auth import HTTPBasicAuth
+import asyncio
 
-from app.config import JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN
+import httpx
+import orjson
 
+from app.config import JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN, JIRA_CONNECTION_POOL_SIZE
 
-def post_comment(issue_key: str, comment_text: str) -> dict:
+# Statuses meaning Jira did not process the request, so even a comment
+# POST can be retried without creating a duplicate.
+_RETRY_STATUSES = (429, 503)
+_MAX_RETRIES = 5
+
+# Upper bounds (seconds) on one back-off and on all back-offs for a request.
+# A long Retry-After from Jira must not hold a request handler for hours.
+_MAX_RETRY_DELAY = 30.0
+_RETRY_BUDGET = 60.0
+
+# Deadline (seconds) for a whole post_comments() batch.
+BULK_POST_TIMEOUT = 120.0
+
+_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Return the Jira client for the running event loop, building it on first use.
+
+    Concurrent calls share it and reuse pooled (HTTP/2 multiplexed)
+    connections instead of paying a TCP + TLS handshake each time. Pooled
+    connections are bound to the loop that opened them, and the serverless
+    runtime may run each invocation on a fresh loop, so clients are kept per
+    loop. Clients of loops that are no longer running are dropped when a new
+    loop shows up.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        for stale in [other for other in _clients if not other.is_running()]:
+            del _clients[stale]
+        client = _clients[loop] = httpx.AsyncClient(
+            base_url=JIRA_BASE_URL or "",
+            auth=(JIRA_EMAIL or "", JIRA_API_TOKEN or ""),
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=JIRA_CONNECTION_POOL_SIZE,
+                max_keepalive_connections=JIRA_CONNECTION_POOL_SIZE,
+            ),
+        )
+    return client
+
+
+def _comment_body(comment_text: str) -> bytes:
+    """Serialize the v2 comment payload, {"body": comment_text}, straight to bytes."""
+    return b'{"body":' + orjson.dumps(comment_text) + b"}"
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), _MAX_RETRY_DELAY)
+    return min(float(2 ** attempt), _MAX_RETRY_DELAY)
+
+
+async def _request(method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a request, backing off and retrying while Jira answers 429/503.
+
+    Gives up and returns the last response once _MAX_RETRIES retries or
+    _RETRY_BUDGET seconds of back-off have been used.
+    """
+    waited = 0.0
+    for attempt in range(_MAX_RETRIES + 1):
+        response = await _get_client().request(method, url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+            return response
+        delay = _retry_delay(response, attempt)
+        if waited + delay > _RETRY_BUDGET:
+            return response
+        waited += delay
+        await asyncio.sleep(delay)
+
+
+async def post_comment(issue_key: str, comment_text: str) -> dict:
     """
     Post a comment to a Jira issue.
 
     Uses REST API v2 with plain-text body for compatibility
     with both Jira Cloud and Jira Server/Data Center.
     """
-    url = f"{JIRA_BASE_URL}/rest/api/2/issue/{issue_key}/comment"
-
-    headers = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-    }
-
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
+    url = f"/rest/api/2/issue/{issue_key}/comment"
 
-    payload = {"body": comment_text}
-
-    response = requests.post(url, json=payload, headers=headers, auth=auth)
+    response = await _request("POST", url, content=_comment_body(comment_text))
 
     if response.status_code not in (200, 201):
         raise Exception(
@@ -40,16 +109,48 @@ def post_comment(issue_key: str, comment_text: str) -> dict:
     return response.json()
 
 
-def get_issue(issue_key: str) -> dict:
+async def post_comments(items: list[tuple[str, str]]) -> list:
     """
-    Fetch basic issue details from Jira.
+    Post many comments concurrently, one per (issue_key, comment_text) pair.
+
+    Returns a list aligned with ``items`` holding either the Jira response
+    dict or the exception raised for that comment, so one failure does
+    not abort the rest of the batch. Comments still unfinished after
+    BULK_POST_TIMEOUT seconds are cancelled and reported as TimeoutError.
     """
-    url = f"{JIRA_BASE_URL}/rest/api/2/issue/{issue_key}"
+    if not items:
+        return []
+
+    slots = asyncio.Semaphore(JIRA_CONNECTION_POOL_SIZE)
 
-    headers = {"Accept": "application/json"}
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
+    async def post_one(issue_key: str, comment_text: str) -> dict:
+        async with slots:
+            return await post_comment(issue_key, comment_text)
+
+    tasks = [asyncio.ensure_future(post_one(key, text)) for key, text in items]
+    _, pending = await asyncio.wait(tasks, timeout=BULK_POST_TIMEOUT)
+    for task in pending:
+        task.cancel()
+
+    results = []
+    for (issue_key, _), task in zip(items, tasks):
+        if task in pending:
+            results.append(TimeoutError(
+                f"Timed out after {BULK_POST_TIMEOUT:.0f} s posting to {issue_key}; "
+                f"the comment may or may not have been posted"
+            ))
+        else:
+            results.append(task.exception() or task.result())
+    return results
+
+
+async def get_issue(issue_key: str) -> dict:
+    """
+    Fetch basic issue details from Jira.
+    """
+    url = f"/rest/api/2/issue/{issue_key}"
 
-    response = requests.get(url, headers=headers, auth=auth)
+    response = await _request("GET", url)
 
     if response.status_code != 200:
         raise Exception(
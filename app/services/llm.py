@@ -5,34 +5,82 @@ Generates structured Jira updates and leadership summaries
 from track context using Anthropic Claude.
 """
 
-import json
+import asyncio
 
 import anthropic
+import orjson
 
-from app.config import ANTHROPIC_API_KEY
+from app.config import ANTHROPIC_API_KEY, LLM_CACHE_TTL
+from app.services import llm_cache
 
-client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+# Per-attempt timeout (seconds). The SDK default is 10 minutes, which lets a
+# stalled request hold a track (and the preview run) for far too long.
+REQUEST_TIMEOUT = 120.0
+MAX_RETRIES = 2
 
+# Deadline (seconds) for a whole generation, retries included. On a streamed
+# request REQUEST_TIMEOUT only limits the gap between chunks, so this is what
+# bounds total time.
+GENERATION_TIMEOUT = REQUEST_TIMEOUT * (MAX_RETRIES + 1)
 
-def generate_jira_updates(track_context: dict) -> dict:
-    """
-    Generate structured Jira updates for all milestones in a track.
+# Cap on in-flight Claude requests per event loop, to stay within
+# Anthropic's concurrency limits when many tracks run at once.
+MAX_CONCURRENT_REQUESTS = 8
+
+_clients: dict[asyncio.AbstractEventLoop, tuple[anthropic.AsyncAnthropic, asyncio.Semaphore]] = {}
+
+
+def _get_client() -> tuple[anthropic.AsyncAnthropic, asyncio.Semaphore]:
     """
-    milestones_json = json.dumps(track_context.get("milestones", []), indent=2)
-    notes_text = track_context.get("notes_text", "No notes available.")
+    Return the Claude client and request semaphore for the running event
+    loop, building them on first use.
 
-    prompt = f"""You have been given:
+    Both are bound to the loop that first uses them, and the serverless
+    runtime may run each invocation on a fresh loop, so they are kept per
+    loop. Entries for loops that are no longer running are dropped when a
+    new loop shows up.
+
+    HTTP/2 lets concurrent requests share one multiplexed connection
+    instead of opening a TLS connection each. The SDK's
+    DefaultAsyncHttpxClient keeps its own pool and keep-alive defaults.
+    """
+    loop = asyncio.get_running_loop()
+    state = _clients.get(loop)
+    if state is None:
+        for stale in [other for other in _clients if not other.is_running()]:
+            del _clients[stale]
+        client = anthropic.AsyncAnthropic(
+            api_key=ANTHROPIC_API_KEY,
+            timeout=REQUEST_TIMEOUT,
+            max_retries=MAX_RETRIES,
+            http_client=anthropic.DefaultAsyncHttpxClient(http2=True),
+        )
+        state = _clients[loop] = (client, asyncio.Semaphore(MAX_CONCURRENT_REQUESTS))
+    return state
+
+
+MODEL = "claude-sonnet-4-5-20250929"
+
+# Output budget: a base allowance plus room for each milestone's update,
+# capped at MAX_TOKENS, so small tracks don't reserve the full ceiling.
+MAX_TOKENS = 4096
+BASE_OUTPUT_TOKENS = 400
+TOKENS_PER_MILESTONE = 250
+
+# Part of the response-cache key. Bump whenever SYSTEM_PROMPT or the request
+# shape changes so responses produced by the old prompt are not reused.
+PROMPT_VERSION = 3
+
+# Static instructions, identical for every track. Sent first, ahead of the
+# per-track milestones and notes, so they stay a stable request prefix.
+SYSTEM_PROMPT = """You are a program management reporting agent.
+
+You will be given:
 1. A list of milestones for a project track
 2. The full text of the track's notes document
 
 Your job: For each milestone, generate a structured Jira status update.
 
-MILESTONES:
-{milestones_json}
-
-NOTES DOCUMENT:
-{notes_text}
-
 RULES:
 - Map information from the notes document to the correct milestone.
 - If the notes document does not mention a milestone, use the milestone's
@@ -44,43 +92,140 @@ RULES:
 - The leadership_summary should be a single executive-level sentence
   summarizing the milestone status — no task-level detail.
 
-Return ONLY valid JSON in this exact format (no markdown, no explanation):
-
-{{
-  "updates": [
-    {{
-      "jira_id": "the milestone's jira_id",
-      "milestone": "the milestone name",
-      "current_status": "Concise status of where this milestone stands.",
-      "target_date": "The target date",
-      "blockers": ["blocker 1", "blocker 2"] or ["None"],
-      "leadership_summary": "Single executive sentence."
-    }}
-  ]
-}}
+Report the updates by calling the emit_updates tool, with one entry per milestone.
 """
 
-    response = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=4096,
-        system="You are a program management reporting agent.",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.2,
-    )
+# Forcing this tool makes Claude return the updates as already-parsed tool
+# input matching the schema, instead of free-form JSON text.
+UPDATES_TOOL = {
+    "name": "emit_updates",
+    "description": "Return the structured Jira status update for every milestone in the track.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "updates": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "jira_id": {"type": "string", "description": "The milestone's jira_id."},
+                        "milestone": {"type": "string", "description": "The milestone name."},
+                        "current_status": {"type": "string"},
+                        "target_date": {"type": "string"},
+                        "blockers": {"type": "array", "items": {"type": "string"}},
+                        "leadership_summary": {"type": "string"},
+                    },
+                    "required": [
+                        "jira_id",
+                        "milestone",
+                        "current_status",
+                        "target_date",
+                        "blockers",
+                        "leadership_summary",
+                    ],
+                },
+            },
+        },
+        "required": ["updates"],
+    },
+}
+
+
+async def generate_jira_updates(track_context: dict) -> dict:
+    """
+    Generate structured Jira updates for all milestones in a track.
 
-    content = response.content[0].text.strip()
+    Results are cached by milestones + notes, so regenerating an
+    unchanged track does not call the model again. Async, so callers can
+    generate many tracks concurrently with asyncio.gather.
+    """
+    milestones = track_context.get("milestones", [])
+    notes_text = track_context.get("notes_text", "No notes available.")
 
-    # Handle potential markdown code fences in response
-    if content.startswith("```"):
-        content = content.split("\n", 1)[1]
-        if content.endswith("```"):
-            content = content[:-3]
-        content = content.strip()
+    # SQLite calls block, so they run in a worker thread off the event loop
+    cache = llm_cache.get_cache()
+    key = _cache_key(milestones, notes_text)
+    result = await asyncio.to_thread(cache.get, key) if cache else None
+
+    if result is None:
+        # Streamed: the reply arrives as it is generated, which keeps the
+        # connection active through long generations instead of waiting on
+        # one buffered response that can hit idle or read timeouts.
+        client, request_slots = _get_client()
+        async with request_slots:
+            try:
+                response = await asyncio.wait_for(
+                    _stream_message(client, _request_params(milestones, notes_text)),
+                    GENERATION_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Claude did not finish within {GENERATION_TIMEOUT:.0f} s"
+                ) from None
+        result = _parse_response(response)
+        if cache:
+            await asyncio.to_thread(cache.set, key, result, LLM_CACHE_TTL)
+
+    return _with_metadata(result, track_context)
+
+
+def _cache_key(milestones: list, notes_text: str) -> str:
+    return llm_cache.make_key(
+        {"m": milestones, "n": notes_text, "model": MODEL, "v": PROMPT_VERSION}
+    )
 
-    result = json.loads(content)
 
-    # Attach workstream and track metadata
+def _with_metadata(result: dict, track_context: dict) -> dict:
+    """Attach workstream and track metadata."""
     result["workstream"] = track_context.get("workstream", "")
     result["track"] = track_context.get("track", "")
-
     return result
+
+
+async def _stream_message(client: anthropic.AsyncAnthropic, params: dict):
+    """Stream one Messages API request and return the final message."""
+    async with client.messages.stream(**params) as stream:
+        return await stream.get_final_message()
+
+
+def _request_params(milestones: list, notes_text: str) -> dict:
+    """Build the Messages API arguments for one track."""
+    # Compact JSON: indentation only adds billed whitespace tokens. orjson
+    # also leaves non-ASCII text (e.g. "café") unescaped, unlike json.dumps.
+    milestones_json = orjson.dumps(milestones).decode()
+
+    # The tool and system prompt are shared by every track and marked for
+    # Anthropic's prompt cache. Together they are still below Sonnet's
+    # 1,024-token minimum cacheable prefix, so the breakpoint only takes
+    # effect if the instructions grow. The milestones are not marked: a
+    # cache write costs 1.25x, and identical re-runs already hit the
+    # response cache, so that write would rarely be read back.
+    return dict(
+        model=MODEL,
+        max_tokens=min(MAX_TOKENS, BASE_OUTPUT_TOKENS + TOKENS_PER_MILESTONE * len(milestones)),
+        system=[
+            {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+        ],
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": f"MILESTONES:\n{milestones_json}"},
+                    {"type": "text", "text": f"NOTES DOCUMENT:\n{notes_text}"},
+                ],
+            }
+        ],
+        tools=[UPDATES_TOOL],
+        tool_choice={"type": "tool", "name": UPDATES_TOOL["name"]},
+        temperature=0.2,
+    )
+
+
+def _parse_response(response) -> dict:
+    """Return the updates Claude passed to the emit_updates tool."""
+    if response.stop_reason == "max_tokens":
+        raise ValueError("Claude's response was cut off before all updates were returned")
+    for block in response.content:
+        if block.type == "tool_use":
+            return block.input
+    raise ValueError("Claude did not return any updates")
@@ -0,0 +1,89 @@
+"""
+LLM response cache.
+
+Stores generated Jira updates keyed by a hash of everything that determines
+the model's output (milestones, notes, model, prompt version), so re-running
+a preview for an unchanged track returns instantly instead of calling Claude.
+"""
+
+import functools
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Protocol
+
+import orjson
+
+from app.config import LLM_CACHE_PATH, LLM_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[dict[str, Any]]: ...
+
+    def set(self, key: str, value: dict[str, Any], ttl: int) -> None: ...
+
+
+class SQLiteCache:
+    """
+    CacheBackend storing JSON values in a SQLite file (WAL mode).
+
+    SQLite errors (e.g. "database is locked" when several workers share the
+    file) are logged and treated as a miss or a skipped write, so the cache
+    never fails a generation.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at INTEGER NOT NULL)"
+        )
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?",
+                    (key, int(time.time())),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("LLM response cache read failed: %s", e)
+                row = None
+            self.stats["hits" if row else "misses"] += 1
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: dict[str, Any], ttl: int) -> None:
+        now = int(time.time())
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(value), now + ttl),
+                )
+        except sqlite3.Error as e:
+            logger.warning("LLM response cache write failed: %s", e)
+
+
+def make_key(parts: dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON encoding of ``parts``."""
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache() -> Optional[CacheBackend]:
+    """Return the process-wide cache, or None if caching is disabled or unavailable."""
+    if LLM_CACHE_TTL <= 0:
+        return None
+    try:
+        return SQLiteCache(LLM_CACHE_PATH)
+    except sqlite3.Error as e:
+        logger.warning("LLM response cache disabled, cannot open %s: %s", LLM_CACHE_PATH, e)
+        return None
@@ -14,9 +14,10 @@ Required columns:
 """
 
 import re
-from typing import Any
+from collections.abc import Set as AbstractSet
+from typing import Any, Iterable
 
-REQUIRED_COLUMNS = [
+REQUIRED_COLUMNS = (
     "WorkType",
     "Description",
     "Status",
@@ -26,20 +27,32 @@ REQUIRED_COLUMNS = [
     "Notes",
     "Status Update",
     "Comments",
-]
+)
+_REQUIRED_SET = frozenset(REQUIRED_COLUMNS)
+
+
+_JIRA_KEY_RE = re.compile(r"^([A-Za-z]+-)(0*)(\d+)$")
 
 
 def normalize_jira_key(key: str) -> str:
     """Normalize a Jira issue key by stripping leading zeros from the number (e.g. OPS-08 -> OPS-8)."""
-    match = re.match(r"^([A-Za-z]+-)(0*)(\d+)$", key)
+    # Fast path: nothing to strip unless the number starts with a zero
+    dash = key.rfind("-")
+    if dash < 0 or key[dash + 1:dash + 2] != "0":
+        return key
+    match = _JIRA_KEY_RE.match(key)
     if match:
         return match.group(1) + match.group(3)
     return key
 
 
-def validate_schema(headers: list[str]) -> list[str]:
+def validate_schema(headers: Iterable[str]) -> list[str]:
     """Validate that all required columns exist. Returns list of missing columns."""
-    missing = [col for col in REQUIRED_COLUMNS if col not in headers]
+    # Set-like inputs (e.g. dict.keys()) already have O(1) membership
+    header_set = headers if isinstance(headers, AbstractSet) else frozenset(headers)
+    if _REQUIRED_SET <= header_set:
+        return []
+    missing = [col for col in REQUIRED_COLUMNS if col not in header_set]
     return missing
 
 
@@ -47,40 +60,79 @@ def parse_sheet_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
     Parse flat sheet rows into hierarchical structure.
     """
+    if not rows:
+        return []
+    headers = list(rows[0])
+    return parse_sheet_values([headers, *([row.get(h) or "" for h in headers] for row in rows)])
+
+
+def parse_sheet_values(values: list[list[str]]) -> list[dict[str, Any]]:
+    """
+    Parse raw sheet values (header row first) into hierarchical structure.
+
+    Cells are read by column index straight from the value lists, so no
+    intermediate per-row dicts are built.
+    """
+    if not values:
+        return []
+
+    headers = values[0]
+    # Every row is cut/padded to the headers plus one trailing blank cell,
+    # which stands in for any required column the sheet does not have.
+    absent = len(headers)
+    blank = [""] * (absent + 1)
+    col = {header: i for i, header in enumerate(headers)}
+    (
+        i_type, i_desc, i_status, i_target, i_owner, i_jira, i_notes, i_update,
+    ) = (
+        col.get(name, absent)
+        for name in (
+            "WorkType", "Description", "Status", "Target Date",
+            "Milestone Owner", "Jira ID", "Notes", "Status Update",
+        )
+    )
+
     workstream = None
     current_track = None
     tracks: list[dict[str, Any]] = []
 
-    for row in rows:
-        work_type = (row.get("WorkType") or "").strip()
+    # Local aliases keep attribute lookups out of the per-row loop
+    strip = str.strip
+    normalize = normalize_jira_key
+    append_track = tracks.append
 
-        if work_type == "Workstream":
-            workstream = (row.get("Description") or "").strip()
+    for row in values[1:]:
+        row = row[:absent]
+        row += blank[len(row):]
+        work_type = strip(row[i_type])
+
+        if work_type == "Milestone":
+            if current_track is None:
+                continue
+            jira_id = strip(row[i_jira])
+            if not jira_id:
+                continue  # Skip milestones without Jira IDs
+
+            current_track["milestones"].append({
+                "name": strip(row[i_desc]),
+                "status": strip(row[i_status]),
+                "target_date": strip(row[i_target]),
+                "owner": strip(row[i_owner]),
+                "jira_id": normalize(jira_id),
+                "previous_status_update": strip(row[i_update]),
+            })
 
         elif work_type == "Track":
             current_track = {
                 "workstream": workstream or "",
-                "track": (row.get("Description") or "").strip(),
-                "track_status": (row.get("Status") or "").strip(),
-                "notes_link": (row.get("Notes") or "").strip(),
+                "track": strip(row[i_desc]),
+                "track_status": strip(row[i_status]),
+                "notes_link": strip(row[i_notes]),
                 "milestones": [],
             }
-            tracks.append(current_track)
+            append_track(current_track)
 
-        elif work_type == "Milestone" and current_track is not None:
-            jira_id = (row.get("Jira ID") or "").strip()
-            if not jira_id:
-                continue  # Skip milestones without Jira IDs
-            jira_id = normalize_jira_key(jira_id)
-
-            milestone = {
-                "name": (row.get("Description") or "").strip(),
-                "status": (row.get("Status") or "").strip(),
-                "target_date": (row.get("Target Date") or "").strip(),
-                "owner": (row.get("Milestone Owner") or "").strip(),
-                "jira_id": jira_id,
-                "previous_status_update": (row.get("Status Update") or "").strip(),
-            }
-            current_track["milestones"].append(milestone)
+        elif work_type == "Workstream":
+            workstream = strip(row[i_desc])
 
     return tracks
@@ -4,24 +4,46 @@ Google Sheets service.
 Reads tracker spreadsheet data using a service account.
 """
 
+import sys
+import threading
+
 from googleapiclient.discovery import build
 
 from app.config import get_google_credentials
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+WRITE_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+_local = threading.local()
 
-def _get_sheets_service():
-    credentials = get_google_credentials(SCOPES)
-    return build("sheets", "v4", credentials=credentials)
 
+def _get_sheets_service(scopes: list[str] = SCOPES):
+    """
+    Return a Sheets API client for ``scopes``, building it at most once per
+    thread and scope set.
 
-def read_sheet(sheet_id: str, range_name: str = "Sheet1") -> list[dict[str, str]]:
+    The underlying httplib2 transport is not thread-safe, so each worker
+    thread keeps its own clients instead of sharing them process-wide.
     """
-    Read all rows from a Google Sheet and return as list of dicts.
+    services = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
 
-    The first row is treated as headers. Each subsequent row becomes a dict
-    keyed by the header values.
+    key = tuple(scopes)
+    service = services.get(key)
+    if service is None:
+        credentials = get_google_credentials(scopes)
+        service = build("sheets", "v4", credentials=credentials, cache_discovery=False)
+        services[key] = service
+    return service
+
+
+def read_values(sheet_id: str, range_name: str = "Sheet1") -> list[list[str]]:
+    """
+    Read the raw cell values of a Google Sheet, header row first.
+
+    Rows are returned as the API sends them (trailing empty cells omitted),
+    for callers that can work by column index without building row dicts.
     """
     service = _get_sheets_service()
     result = (
@@ -31,18 +53,32 @@ def read_sheet(sheet_id: str, range_name: str = "Sheet1") -> list[dict[str, str]
         .execute()
     )
 
-    values = result.get("values", [])
+    return result.get("values", [])
+
+
+def read_sheet(sheet_id: str, range_name: str = "Sheet1") -> list[dict[str, str]]:
+    """
+    Read all rows from a Google Sheet and return as list of dicts.
+
+    The first row is treated as headers. Each subsequent row becomes a dict
+    keyed by the header values.
+    """
+    return _rows_from_values(read_values(sheet_id, range_name))
+
+
+def _rows_from_values(values: list[list[str]]) -> list[dict[str, str]]:
     if len(values) < 2:
         return []
 
-    headers = values[0]
+    # Interned headers let later row.get("WorkType") lookups match by identity
+    headers = [sys.intern(header) for header in values[0]]
+    width = len(headers)
     rows: list[dict[str, str]] = []
 
     for row_values in values[1:]:
-        row_dict: dict[str, str] = {}
-        for i, header in enumerate(headers):
-            row_dict[header] = row_values[i] if i < len(row_values) else ""
-        rows.append(row_dict)
+        # The API omits trailing empty cells; pad them back in (zip truncates extras)
+        pad = width - len(row_values)
+        rows.append(dict(zip(headers, row_values + [""] * pad if pad > 0 else row_values)))
 
     return rows
 
@@ -51,12 +87,19 @@ def update_cell(sheet_id: str, range_name: str, value: str) -> None:
     """
     Write a single value to a specific cell in the sheet.
     """
-    credentials = get_google_credentials(["https://www.googleapis.com/auth/spreadsheets"])
-    service = build("sheets", "v4", credentials=credentials)
+    update_cells(sheet_id, [(range_name, value)])
+
+
+def update_cells(sheet_id: str, updates: list[tuple[str, str]]) -> None:
+    """
+    Write several (range, value) pairs in a single batchUpdate request.
+    """
+    service = _get_sheets_service(WRITE_SCOPES)
 
-    service.spreadsheets().values().update(
+    service.spreadsheets().values().batchUpdate(
         spreadsheetId=sheet_id,
-        range=range_name,
-        valueInputOption="RAW",
-        body={"values": [[value]]},
+        body={
+            "valueInputOption": "RAW",
+            "data": [{"range": r, "values": [[v]]} for r, v in updates],
+        },
     ).execute()